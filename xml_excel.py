@@ -1,9 +1,54 @@
+from copy import copy
 from datetime import datetime
 from io import BytesIO
-from os.path import exists, splitext
-from zipfile import ZipFile
+from itertools import product
+from os import remove, replace
+from os.path import abspath, dirname, exists, splitext
+from shutil import copyfileobj, copymode
+from string import ascii_uppercase
+from tempfile import NamedTemporaryFile
+from zipfile import ZipExtFile, ZipFile, ZIP_DEFLATED
 import re
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+
+# Namespaces fixed by the OOXML spec, with the fully qualified tags used on the hot paths
+OOXML_NS = {
+    "default": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
+    "x14ac": "http://schemas.microsoft.com/office/spreadsheetml/2009/9/ac",
+    "rels": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+
+NS_C = f"{{{OOXML_NS['default']}}}c"
+NS_V = f"{{{OOXML_NS['default']}}}v"
+NS_ROW = f"{{{OOXML_NS['default']}}}row"
+NS_SI = f"{{{OOXML_NS['default']}}}si"
+NS_T = f"{{{OOXML_NS['default']}}}t"
+NS_R = f"{{{OOXML_NS['default']}}}r"
+NS_SHEETDATA = f"{{{OOXML_NS['default']}}}sheetData"
+NS_DIMENSION = f"{{{OOXML_NS['default']}}}dimension"
+NS_SHEETS = f"{{{OOXML_NS['default']}}}sheets"
+NS_SHEET = f"{{{OOXML_NS['default']}}}sheet"
+NS_REL = f"{{{OOXML_NS['rels']}}}Relationship"
+_R_ID = f"{{{OOXML_NS['r']}}}id"
+
+# Content of the sharedStrings.xml created for workbooks which do not have one yet
+_EMPTY_SST = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="1" uniqueCount="1">'
+    b'<si><t>temp_string</t></si>'
+    b'</sst>'
+)
+
+# Column letters indexed by their 1-based column number, from A up to excel's last column XFD
+COL_NAMES = (None, *("".join(letters) for size in (1, 2, 3) for letters in product(ascii_uppercase, repeat=size)))[:16385]
+COL_INDEX = {name: index for index, name in enumerate(COL_NAMES) if name is not None}
+
+# Cell reference split into its column letters and row number, ie.: BC23 --> BC, 23
+_CELL_RE = re.compile(r"([A-Z]+)(\d+)")
 
 
 class Workbook:
@@ -19,24 +64,28 @@ class Workbook:
 
         self.fp = fp
         self._zip = None
+        self._stream_cache = {}
+        self._props = {}
 
 
     # With/open support
     def __enter__(self):
 
         self._zip = ZipFile(self.fp, "r")
+        self._index_archive()
 
         self._file_integrity_assessment()
 
-        self._set_props()
+        # A reopened file is read again, its sheets start from an empty container
+        self._clear_props()
+        self._props.pop("sheets", None)
 
         return self
     
 
     def __exit__(self, exc_type, exc_value, traceback):
  
-        self._zip.close()
-        self._zip = None
+        self.close()
 
     
     # Manual file handling
@@ -46,12 +95,15 @@ class Workbook:
    
 
     def close(self):
+        """Closes the file. The workbook data read so far and the loaded sheets stay available."""
 
         if self._zip is not None:
 
             self._zip.close()
             self._zip = None
 
+        self._stream_cache.clear()
+
     
     # Init methods
     def _validate_path(self, fp: str):
@@ -79,29 +131,75 @@ class Workbook:
         """Saves the modifications done on the excel file.
 
         Args:
-            paths (list[str]): List of files to modify.
+            paths (list[str]): List of files to modify or add.
             streams (list): List of new xml files in bytes.
         Returns:
             None
         """
 
-        # TODO - replace function, to use the harddrive instead of memory
+        override = dict(zip(paths, streams))
+
+        # The new archive is written to the harddrive next to the original one, so it can be moved in its place
+        temp = NamedTemporaryFile(dir=dirname(abspath(self.fp)), suffix=splitext(self.fp)[1], delete=False)
 
-        # List every file from the excel into the memory
-        temp_buffer = BytesIO()
+        try:
 
-        with ZipFile(temp_buffer, 'w') as zip_buffer:
-            for item in self._zip.infolist():
-                content = self._zip.read(item.filename)
-                zip_buffer.writestr(item, streams[paths.index(item.filename)] if item.filename in paths else content)
+            # Copy every file into a new archive in one pass, swapping the modified ones on the fly
+            # The modified xml files are compressed at level 1, which is almost as small for xml but much faster
+            # Writing updates the offsets and sizes of the ZipInfo, so copies are used to keep the open archive readable
+            with temp, ZipFile(temp, 'w', compression=ZIP_DEFLATED, allowZip64=True) as file:
+                for item in map(copy, self._zip.infolist()):
+
+                    if item.filename in override:
+                        file.writestr(item, override[item.filename], compress_type=ZIP_DEFLATED, compresslevel=1)
+
+                    else:
+                        with self._zip.open(item) as source, file.open(item, 'w') as target:
+                            copyfileobj(source, target, 1 << 20)
 
-        # Put back every element
-        with ZipFile(self.fp, 'w') as file:
-            with ZipFile(temp_buffer, 'r') as temp:
-                for item in temp.infolist():
-                    file.writestr(item, temp.read(item.filename))
+                # Append the files which are not part of the archive yet
+                for path, stream in override.items():
+                    if path not in self._filenames:
+                        file.writestr(path, stream, compress_type=ZIP_DEFLATED, compresslevel=1)
+
+            # Temporary files are private by default, keep the permissions of the original file
+            copymode(self.fp, temp.name)
+
+        except BaseException:
+
+            remove(temp.name)
+            raise
+
+        # Put the new archive in place of the original one
+        self._zip.close()
+        replace(temp.name, self.fp)
 
         self._zip = ZipFile(self.fp, 'r')
+        self._index_archive()
+
+        # Only the rewritten files changed, the rest of the cached content is still valid
+        for path in paths:
+            self._stream_cache.pop(path, None)
+
+
+    def _read_xml(self, filename: str) -> bytes:
+        """Returns the content of a file inside the excel file. It is kept in memory until the file is modified,
+        so reading it again does not decompress it again.
+
+        Args:
+            filename (str): The path of the file inside the excel file.
+        Returns:
+            bytes: The content of the file.
+        """
+
+        stream = self._stream_cache.get(filename)
+
+        if stream is None:
+
+            stream = get_stream(self._zip, filename)
+            self._stream_cache[filename] = stream
+
+        return stream
 
 
     # Methods after open is ran
@@ -115,134 +213,171 @@ class Workbook:
         required_folders = ['docProps', 'xl', 'xl/theme', 'xl/worksheets']
         required_files = ['docProps/core.xml', 'docProps/app.xml']
 
-        self._folders = self._list_folders()
-
         for folder in required_folders:
             if folder not in self._folders:
 
                 raise UserWarning(f"File corrupted: the {folder} folder is not found in the excel file.")
 
-        current_files = [x.filename for x in self._zip.filelist]
-
         for file in required_files:
-            if file not in current_files:
+            if file not in self._filenames:
                 raise UserWarning(f"File corrupted: the {file} xml file is not found in the excel file.")
 
-        # Create the sharedstrings.xml file if the excel file is empty
-        self._add_sharedstrings()
 
-
-    def _list_folders(self) -> list[str]:
-        """Returns every folder found in the compressed excel file.
+    def _index_archive(self):
+        """Caches the files and folders of the opened archive, so membership checks do not rescan it.
 
         Returns:
-            list[str]: List of folders.
+            None
         """
 
-        folders = []
+        self._filenames = set(self._zip.NameToInfo)
 
-        for full_path in self._zip.filelist:
+        self._folders = self._list_folders()
 
-            split_path = full_path.filename.split("/")
 
-            parent = ""
-            for i in range(len(split_path) - 1):
+    def _list_folders(self) -> set[str]:
+        """Returns every folder found in the compressed excel file.
 
-                folder = split_path[i] if parent == "" else parent + "/" + split_path[i]
+        Returns:
+            set[str]: Set of folders.
+        """
 
-                if folder not in folders:
+        folders = set()
 
-                    folders.append(folder)
+        for filename in self._filenames:
 
-                parent = folder
+            split_path = filename.split("/")
+
+            for i in range(1, len(split_path)):
+
+                folders.add("/".join(split_path[:i]))
 
         return folders
     
 
-    def _add_sharedstrings(self):
-        """Creates the sharedStrings.xml file in case it is missing. The relationships are also added to other xml files.
+    def _add_sharedstrings(self) -> dict[str, bytes]:
+        """Prepares the sharedStrings.xml file in case it is missing. The relationships are also added to other xml files.
+        Nothing is saved here, so the caller can write these files together with its own modifications.
 
         Returns:
-            None
+            dict[str, bytes]: The files to add or modify, mapped to their new content.
+                              Empty if the sharedStrings.xml is already part of the excel file.
         """
         
         fn = "xl/sharedStrings.xml"
 
-        # Create the file in case it does not exist
-        if fn not in [x.filename for x in self._zip.filelist]:
+        # Nothing to do if the file is already part of the workbook
+        if fn in self._filenames:
+            return {}
 
-            xml_content = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-                             <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="1" uniqueCount="1">
-                                <si>
-                                    <t>temp_string</t>
-                                </si>
-                             </sst>'''
+        # Add the sharedStrings data into the relationships file so Excel is able to communicate with it
+        rel_stream = self._read_xml("xl/_rels/workbook.xml.rels")
+        rel_root = ET.fromstring(rel_stream)
+        ns = rel_root.tag.split('}')[0][1:]
 
-            xml_content.encode('utf-8')
+        new_id = self._next_id(rel_root)
 
-            self._zip.close()
+        rel_node = ET.SubElement(rel_root, f"{{{ns}}}Relationship")
+        rel_node.set('Id', new_id)
+        rel_node.set('Type', 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings')
+        rel_node.set('Target', 'sharedStrings.xml')
 
-            with ZipFile(self.fp, 'a') as file:
-                file.writestr(fn, xml_content)
+        # Refresh the content types.xml
+        content_stream = self._read_xml('[Content_Types].xml')
+        content_root = ET.fromstring(content_stream)
+        content_ns = content_root.tag.split('}')[0][1:]
+        content_node = ET.SubElement(content_root, f"{{{content_ns}}}Override")
+        content_node.set('PartName', '/xl/sharedStrings.xml')
+        content_node.set('ContentType', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml')
 
-            self._zip = ZipFile(self.fp, 'r')
+        return {
+            "xl/_rels/workbook.xml.rels": get_xml_declaration(rel_stream) + ET.tostring(rel_root, encoding='utf-8'),
+            "[Content_Types].xml": get_xml_declaration(content_stream) + ET.tostring(content_root, encoding='utf-8'),
+            fn: _EMPTY_SST
+        }
 
-            # Add the sharedStrings data into the relationships file so Excel is able to communicate with it
-            rel_stream = get_stream(self._zip, "xl/_rels/workbook.xml.rels")
-            rel_root = ET.ElementTree(ET.fromstring(rel_stream)).getroot()
-            ns = rel_root.tag.split('}')[0][1:]
 
-            new_id = self._next_id(rel_stream)
+    def _next_id(self, rel_root: ET.Element) -> str:
+        """Get next available ID in .rels file.
 
-            rel_node = ET.SubElement(rel_root, f"{{{ns}}}Relationship")
-            rel_node.set('Id', new_id)
-            rel_node.set('Type', 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings')
-            rel_node.set('Target', 'sharedStrings.xml')
+        Args:
+            rel_root (ET.Element): Parsed root of .rels file.
+        Returns:
+            str: Next available ID.
+        """
 
-            # Refresh the content types.xml
-            content_stream = get_stream(self._zip, '[Content_Types].xml')
-            content_root = ET.ElementTree(ET.fromstring(content_stream)).getroot()
-            content_ns = content_root.tag.split('}')[0][1:]
-            content_node = ET.SubElement(content_root, f"{{{content_ns}}}Override")
-            content_node.set('PartName', '/xl/sharedStrings.xml')
-            content_node.set('ContentType', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml')
+        # The caller already parsed the file, so a single walk over its relationships is enough
+        max_id = 0
+        for rel in rel_root.iterfind(NS_REL):
+            rel_id = rel.get('Id', '')[3:]
+            if rel_id.isdigit() and int(rel_id) > max_id:
+                max_id = int(rel_id)
 
-            # Save all modifications
-            self._save_xml(
-                ["xl/_rels/workbook.xml.rels", "[Content_Types].xml"],
-                [ET.tostring(rel_root, encoding='utf-8'), ET.tostring(content_root, encoding='utf-8')]
-            )
+        return f"rId{max_id + 1}"
 
+    
+    def _clear_props(self):
+        """Drops the cached data of the excel file, so each property is read again on its next access.
+        The loaded sheets are not parsed data of the file, so they are kept.
+        """
 
-    def _next_id(self, stream: str) -> str:
-        """Get next available ID in .rels file.
+        for name in ("modification_date", "version", "sheet_ids", "sheet_metadata"):
+            self._props.pop(name, None)
+
+        self._stream_cache.clear()
+
+
+    def _get_prop(self, name: str, loader) -> object:
+        """Returns a cached property of the excel file, which is read with the loader on its first access.
 
         Args:
-            stream (str): Content of .rels file.
+            name (str): Name of the property.
+            loader (callable): Method which reads the value from the file.
         Returns:
-            str: Next available ID.
+            object: The value of the property.
         """
-        tree = ET.ElementTree(ET.fromstring(stream))
 
-        relationships = tree.getroot().findall(".//{http://schemas.openxmlformats.org/package/2006/relationships}Relationship")
+        if name in self._props:
+            return self._props[name]
 
-        ids = {int(rel.attrib['Id'].replace('rId', '')) for rel in relationships}
+        value = loader()
 
-        return f"rId{max(ids, default=0) + 1}"
+        # A closed file only gives empty values, those are not kept so the file is read after the next open
+        if self._zip is not None:
+            self._props[name] = value
 
-    
-    def _set_props(self):
-        """Sets basic data from the excel file to the class instance."""
+        return value
 
-        self.modification_date = self.return_date()
 
-        self.version = self.return_version()
+    # Basic data from the excel file, every value is parsed only when it is first used
+    @property
+    def modification_date(self) -> datetime | None:
 
-        self.sheet_ids = self.return_sheets()
+        return self._get_prop("modification_date", self.return_date)
 
-        self.sheet_metadata = self.return_metadata()
 
-        self.sheets = self.prepare_sheet_container()
+    @property
+    def version(self) -> str | None:
+
+        return self._get_prop("version", self.return_version)
+
+
+    @property
+    def sheet_ids(self) -> dict:
+
+        return self._get_prop("sheet_ids", self.return_sheets)
+
+
+    @property
+    def sheet_metadata(self) -> dict:
+
+        return self._get_prop("sheet_metadata", self.return_metadata)
+
+
+    @property
+    def sheets(self) -> dict:
+
+        return self._get_prop("sheets", self.prepare_sheet_container)
 
 
     def return_date(self) -> datetime | None:
@@ -294,11 +429,16 @@ class Workbook:
 
         if self._zip is not None:
 
-            data = process_xml(self._zip, 'xl/workbook.xml', ".//default:sheets/default:sheet", "value")
+            with _stream_xml(self._zip, 'xl/workbook.xml') as file:
+                for _, node in ET.iterparse(file):
 
-            for elem in data:
+                    if node.tag == NS_SHEET:
 
-                sheet_dict[elem['name']] = elem[list(elem.keys())[-1]]
+                        sheet_dict[node.attrib['name']] = node.attrib[_R_ID]
+
+                    # Nothing else is needed once the sheet list is read
+                    elif node.tag == NS_SHEETS:
+                        break
 
         return sheet_dict
 
@@ -317,10 +457,9 @@ class Workbook:
 
         if self._zip is not None:
 
-            stream = get_stream(self._zip, "xl/_rels/workbook.xml.rels")
+            stream = self._read_xml("xl/_rels/workbook.xml.rels")
 
-            tree = ET.ElementTree(ET.fromstring(stream))
-            relationships = tree.getroot().findall(".//{http://schemas.openxmlformats.org/package/2006/relationships}Relationship")
+            relationships = ET.fromstring(stream).findall(f".//{NS_REL}")
 
             for relation in relationships:
 
@@ -355,19 +494,10 @@ class Workbook:
         if 0 in [row, col]:
             raise UserWarning("Row and column indices must be greater than zero (1-based indexing).")
 
-        range = ""
-
-        while col > 0:
-
-            col -= 1
+        if col >= len(COL_NAMES):
+            raise UserWarning(f"Column index {col} is beyond the last excel column ({COL_NAMES[-1]}).")
 
-            range = chr(ord('A') + col % 26) + range
-
-            col //= 26
-
-        range += str(row)
-
-        return range
+        return COL_NAMES[col] + str(row)
     
 
     def _translate_end_point(self, end_point: str) -> tuple[int]:
@@ -382,17 +512,7 @@ class Workbook:
                              and the second element is the column number (int).
         """
 
-        column = re.search("[A-Z]+", end_point).group(0)
-
-        row_index = int(end_point.replace(column, ""))
-
-        column_index = 0
-
-        for char in column:
-
-            column_index = column_index * 26 + (ord(char) - ord("A")) + 1
-
-        return row_index, column_index
+        return _parse_ref(end_point)
  
 
     def _get_sheet_id(self, sheet_id: int | str) -> str:
@@ -434,17 +554,22 @@ class Workbook:
         if self._zip is None:
             return []
 
-        return [self.read_sheet(i) for i in range(len(self.sheets))]
+        # The shared strings are common to every sheet, so they are only parsed once
+        values = self._read_shared_strings()
+
+        return [self.read_sheet(i, values=values) for i in range(len(self.sheets))]
 
 
 
-    def read_sheet(self, sheet_id: str | int, headers: list | None=None) -> list[list[str]]:
+    def read_sheet(self, sheet_id: str | int, headers: list | None=None, values: dict | None=None) -> list[list[str]]:
         """Reads the content of a specified sheet from the workbook and returns it as a 2D list of strings.
 
         Args:
             sheet_id (str | int): Name or index of the sheet.
             headers (list | None, optional): A list of header strings to replace the first row's headers.
                                              If None, original headers are kept. Defaults to None.
+            values (dict | None, optional): Already parsed shared strings, as returned by _read_shared_strings.
+                                            If None, they are read from the file. Defaults to None.
 
         Returns:
             list[list[str]]: A 2D list representing the sheet's rows and columns,
@@ -460,8 +585,8 @@ class Workbook:
             path = f"xl/{self.sheet_metadata[key]}"
 
             # Get the general file which stores every value accross each sheet as a dict
-            values = process_xml(self._zip, "xl/sharedStrings.xml", ".//default:si/default:t", "text")
-            values = {index: value for index, value in enumerate(values)}
+            if values is None:
+                values = self._read_shared_strings()
 
             # Get the coordinates for the active range
             end_point = self._get_dimension(path)
@@ -483,6 +608,23 @@ class Workbook:
             return sheet.table
 
 
+    def _read_shared_strings(self) -> dict[int, str]:
+        """Returns the content of the sharedStrings.xml, which stores the string values of every sheet.
+
+        Returns:
+            dict[int, str]: Mapping of shared string IDs to their corresponding string values.
+        """
+
+        # Workbooks without any string value may not have the file at all
+        if "xl/sharedStrings.xml" not in self._filenames:
+            return {}
+
+        root = ET.fromstring(self._read_xml("xl/sharedStrings.xml"))
+
+        # Each <si> counts as one ID, rich text entries included
+        return {index: _si_text(node) for index, node in enumerate(root.iterfind(NS_SI))}
+
+
     def _get_dimension(self, path: str) -> str:
         """Returns the last used cell ID of the given sheet ie.: A8, C95, ZA51... (column + row)
 
@@ -492,13 +634,19 @@ class Workbook:
             str: Identifier for the cell.
         """
 
-        stream = get_stream(self._zip, path)
+        result = None
+
+        # The dimension is near the top of the sheet, so the parsing stops as soon as it is found
+        with _stream_xml(self._zip, path) as file:
+            for _, node in ET.iterparse(file):
 
-        namespaces = gather_namespaces(BytesIO(stream.encode('utf-8')))
+                if node.tag == NS_DIMENSION:
 
-        result = get_xml_value(stream, ".//default:dimension", namespaces, "value")[0]
+                    result = node.attrib['ref']
+                    break
 
-        result = list(result.values())[0]
+        if result is None:
+            raise UserWarning(f"The used range could not be found in {path}.")
 
         result = result.split(":")
 
@@ -525,13 +673,10 @@ class Workbook:
             key = self.sheet_ids[sheet_id]
             path = f"xl/{self.sheet_metadata[key]}"
 
-            # Gather the data from the XML file
-            stream = get_stream(self._zip, path)
-            namespaces = gather_namespaces(BytesIO(stream.encode('utf-8')))
-
-            # Get the tree
-            tree = ET.ElementTree(ET.fromstring(stream))
-            root = tree.getroot()
+            # Get the tree and its namespaces from the XML file
+            stream = self._read_xml(path)
+            header = get_xml_declaration(stream)
+            root, namespaces = parse_with_namespaces(stream)
 
             # Analyze the new table
             end_point = "A1" if not new_table else self._translate_coords(len(new_table), len(new_table[0]))
@@ -540,10 +685,11 @@ class Workbook:
             root = remove_child_nodes(root, namespaces, ".//default:sheetData")
 
             # Insert the table
-            stream = self._insert_new_values_to_xml(root, namespaces, new_table, end_point)
+            stream, modified_files = self._insert_new_values_to_xml(root, namespaces, new_table, end_point)
 
-            # Refresh the xml file
-            self._save_xml([path], [stream.encode('utf8')])
+            # Refresh the xml files in a single rewrite, ET drops the original declaration so it is put back
+            modified_files[path] = header + stream
+            self._save_xml(list(modified_files), list(modified_files.values()))
 
             # After every modification refresh the current_sheet
             sheet = self.Worksheet(self, (len(new_table), len(new_table[0])), key, path)
@@ -551,8 +697,9 @@ class Workbook:
             self.sheets[sheet_id] = sheet
             
 
-    def _insert_new_values_to_xml(self, root: ET.ElementTree, namespaces: dict, table: list[list], end_point: str) -> str:
+    def _insert_new_values_to_xml(self, root: ET.Element, namespaces: dict, table: list[list], end_point: str) -> tuple[bytes, dict]:
         """Updates the sharedStrings xml and the XML file for the given sheet with the new content.
+        Nothing is saved here, the caller writes every modified file in one go.
 
         Args:
             root (ET.Element): The XML root of the sheet.
@@ -561,102 +708,76 @@ class Workbook:
             end_point (str): Last cell of the used range.
 
         Returns:
-            str: The modified root.
+            tuple[bytes, dict[str, bytes]]:
+                - The modified root.
+                - The other files to add or modify (sharedStrings.xml and its relationships), mapped to their new content.
         """
 
-        # Create the sharedstrings.xml file if not found
-        self._add_sharedstrings()
-
-        # Gather sharedStrings data
-        stream = get_stream(self._zip, "xl/sharedStrings.xml")
-        str_xml_ns = gather_namespaces(BytesIO(stream.encode('utf-8')))
+        # Create the sharedstrings.xml file if not found, it is saved together with the new strings
+        modified_files = self._add_sharedstrings()
 
         # Create the hierarchy object for the sharedStrings.xml
-        str_xml = ET.ElementTree(ET.fromstring(stream))
-        str_xml_root = str_xml.getroot()
+        stream = modified_files.get("xl/sharedStrings.xml") or self._read_xml("xl/sharedStrings.xml")
+        str_xml_header = get_xml_declaration(stream)
+        str_xml_root, _ = parse_with_namespaces(stream)
         str_xml_count = int(str_xml_root.attrib.get('count', 0))
         original_count = str_xml_count
 
+        # Index the shared strings once, every string cell is then resolved with a dict lookup
+        str_xml_nodes = str_xml_root.findall(NS_SI)
+        str_xml_unique = len(str_xml_nodes)
+        sst_index = {}
+
+        for index, node in enumerate(str_xml_nodes):
+
+            sst_index.setdefault(_si_text(node), index)
+
         # First modify the endpoint
         dim = root.findall(".//default:dimension", namespaces)[0]
         dim.set('ref', f"A1:{end_point}")
 
+        # The rows are rebuilt as text, so the emptied node has to serialize as a self-closing tag
         sheet_data = root.findall(".//default:sheetData", namespaces)[0]
-        base_ns = namespaces['default']
+        sheet_data.text = None
 
         # Add every value to the files
-        for i, row in enumerate(table, 1):
-
-            row_node = ET.SubElement(sheet_data, ET.QName(base_ns, 'row'))
-            row_node.set('r', str(i))
-            row_node.set('spans', f'1:{len(row)}')
-            row_node.set('x14ac:dyDescent', '0.25')
+        rows, new_strings = build_sheet_data(table, sst_index, str_xml_unique)
 
-            for j, element in enumerate(row, 1):
+        # Build the new sharedstrings.xml nodes standalone and attach them to the root at once
+        si_nodes = []
 
-                cell_node = ET.SubElement(row_node, ET.QName(base_ns, 'c'))
-                cell_node.set('r', self._translate_coords(i, j))
- 
-                value_node = ET.SubElement(cell_node, ET.QName(base_ns, 'v'))
+        for element in new_strings:
 
-                # Handle string elements, they are stored in the sharedStrings.xml, the sheet file only contains the reference to this element
-                if isinstance(element, str):
+            # Add the original value to sharedstrings.xml
+            str_xml_node = ET.Element(NS_SI)
+            ET.SubElement(str_xml_node, NS_T).text = element
+            si_nodes.append(str_xml_node)
 
-                    cell_node.set('t', 's')
+        str_xml_root.extend(si_nodes)
 
-                    found, index = self._is_string_used(str_xml_root, str_xml_ns, element)
-
-                    if found:
-                        value_node.text = str(index)
-
-                    else:
-
-                        # Instead of the value we insert the index to the sharedStrings.xml element
-                        value_node.text = str(str_xml_count)
-
-                        str_xml_count += 1
-
-                        # Add the original value to sharedstrings.xml
-                        str_xml_node = ET.SubElement(str_xml_root, ET.QName(base_ns, 'si'))
-                        str_xml_val = ET.SubElement(str_xml_node, ET.QName(base_ns, 't'))
-                        str_xml_val.text = element
-
-                else:
-                    value_node.text = str(element)
+        str_xml_unique += len(new_strings)
+        str_xml_count += len(new_strings)
 
         # Upload back the sheet
         if original_count != str_xml_count:
 
             str_xml_root.set('count', str(str_xml_count))
-            str_xml_root.set('uniqueCount', str(str_xml_count))
-
-        str_xml_str = ET.tostring(str_xml_root, encoding='unicode')
-        self._save_xml(["xl/sharedStrings.xml"], [str_xml_str.encode('utf-8')])
- 
-        return ET.tostring(root, encoding='unicode')
-    
-
-    def _is_string_used(self, str_xml_root: ET.ElementTree, namespaces: dict, value_to_search: str) -> tuple[bool, int]:
-        """Returns whether the string is already part of the sharedStrings.xml and its position.
+            str_xml_root.set('uniqueCount', str(str_xml_unique))
 
-        Args:
-            str_xml_root (ET.ElementTree): Parsed XML tree of sharedStrings.xml.
-            namespaces (dict): Namespace mapping used for XML queries.
-            value_to_search (str): The string value to look for in the shared strings.
+        modified_files["xl/sharedStrings.xml"] = str_xml_header + ET.tostring(str_xml_root, encoding='utf-8')
 
-        Returns:
-            tuple[bool, int]: A tuple where the first element is True if the string is found,
-                              False otherwise; the second element is the index of the string 
-                              if found, or the total number of strings in order to continue.
-        """
+        # Splice the generated rows into the serialized sheet in one shot
+        # The prefixes registered by ET are global and the sharedStrings.xml may have renamed the main namespace,
+        # so it is registered again as the unprefixed one (default_namespace rejects the unqualified attributes)
+        ET.register_namespace('', OOXML_NS['default'])
+        stream = ET.tostring(root, encoding='utf-8')
 
-        items = {x.text: i for i, x in enumerate(str_xml_root.findall(".//default:si/default:t", namespaces)) if x.text}
+        if stream.count(b'<sheetData />') != 1:
+            raise UserWarning("The sheetData node of the sheet could not be located.")
 
-        if value_to_search in items:
-            return True, list(items.keys()).index(value_to_search)
+        sheet_data = b'<sheetData>' + rows + b'</sheetData>'
 
-        else:
-            return False, len(items)
+        return stream.replace(b'<sheetData />', sheet_data, 1), modified_files
     
 
     class Worksheet:
@@ -674,22 +795,43 @@ class Workbook:
             self.parent = parent
             self.ID = rid
             self.path = path
-            self.table = self._resize_table(*end_point)
+            self._row_count, self._col_count = end_point
+            self._flat = self._resize_table(*end_point)
+            self._table = None
+
+
+        @property
+        def table(self) -> list[list[str]]:
+            """The sheet content as a 2D list. The rows are only split from the flat buffer on first access."""
+
+            if self._table is None:
+
+                cols = self._col_count
+                self._table = [self._flat[i:i + cols] for i in range(0, self._row_count * cols, cols)]
+                self._flat = None
 
+            return self._table
 
-        def _resize_table(self, row: int, col: int):
-            """Prepares an empty table to store the sheet content.
+
+        @table.setter
+        def table(self, table: list[list]):
+
+            self._table = table
+            self._flat = None
+
+
+        def _resize_table(self, row: int, col: int) -> list[str]:
+            """Prepares an empty row-major buffer to store the sheet content.
 
             Args:
                 row (int): Row count of the table (starting from 1).
                 col (int): Column count of the table (starting from 1).
             Returns:
-                None
+                list[str]: Flat list of row * col empty cells.
             """
 
-            table = [["" for _ in range(col)] for _ in range(row)]
-
-            return table
+            # A single allocation for the whole sheet, the empty string is shared by every cell
+            return [""] * (row * col)
 
 
         def populate_table(self, values: dict):
@@ -703,52 +845,162 @@ class Workbook:
 
             data_pairs, direct_values = self._process_sheet()
 
+            flat, rows, cols = self._flat, self._row_count, self._col_count
+
             # Handle string values
-            for cell_id, sheet_id in data_pairs.items():
-                row, col = self.parent._translate_end_point(cell_id)
-                self.table[row - 1][col - 1] = values[sheet_id]
+            for row, col, sheet_id in data_pairs:
+                if row > rows or col > cols:
+                    raise UserWarning(f"Cell {COL_NAMES[col]}{row} is outside of the used range of {self.path}.")
+                flat[(row - 1) * cols + col - 1] = values[sheet_id]
 
             # Handle other values
-            for cell_id, value in direct_values.items():
-                row, col = self.parent._translate_end_point(cell_id)
-                self.table[row - 1][col - 1] = value
+            for row, col, value in direct_values:
+                if row > rows or col > cols:
+                    raise UserWarning(f"Cell {COL_NAMES[col]}{row} is outside of the used range of {self.path}.")
+                flat[(row - 1) * cols + col - 1] = value
 
 
-        def _process_sheet(self) -> tuple[dict, dict]:
+        def _process_sheet(self) -> tuple[list, list]:
             """Parses the worksheet XML to extract cell values, separating shared string references and direct values.
+            The cell positions are resolved while streaming, so the values are only walked once more to fill the table.
 
             Returns:
-                tuple[dict[str, int], dict[str, str]]:
-                    - First dict maps cell positions (e.g. 'A1') to shared string IDs (int).
-                    - Second dict maps cell positions to direct string values (non-shared strings).
+                tuple[list[tuple[int, int, int]], list[tuple[int, int, str]]]:
+                    - First list holds (row, column, shared string ID) for every shared string cell.
+                    - Second list holds (row, column, value) for every direct value (non-shared strings).
             """
 
-            data_pairs, values = {}, {}
+            data_pairs, values = [], []
 
-            stream = get_stream(self.parent._zip, self.path)
+            # Stream the sheet so only the row being read is kept in memory
+            with _stream_xml(self.parent._zip, self.path) as file:
 
-            namespaces = gather_namespaces(BytesIO(stream.encode('utf-8')))
+                sheet_data = None
 
-            for node in get_xml_value(stream, ".//default:sheetData/default:row/default:c", namespaces):
+                for event, node in ET.iterparse(file, ("start", "end")):
 
-                is_string = node.attrib.get('t')
+                    if event == "start":
 
-                position = node.attrib['r']
+                        if node.tag == NS_SHEETDATA:
+                            sheet_data = node
 
-                value = node.find(".//default:v", namespaces)
+                        continue
 
-                if value is not None:
+                    if node.tag == NS_C:
 
-                    value = value.text
+                        is_string = node.attrib.get('t')
 
-                    if is_string == 's':
-                        data_pairs[position] = int(value)
-                    else:
-                        values[position] = value
+                        value = node.find(NS_V)
+
+                        if value is not None:
+
+                            row, col = _parse_ref(node.attrib['r'])
+
+                            value = value.text
+
+                            if is_string == 's':
+                                data_pairs.append((row, col, int(value)))
+                            else:
+                                values.append((row, col, value))
+
+                        node.clear()
+
+                    elif node.tag == NS_ROW and sheet_data is not None:
+
+                        sheet_data.remove(node)
+
+                    # Every cell is read, the rest of the sheet (merged cells, formatting...) is not needed
+                    elif node.tag == NS_SHEETDATA:
+                        break
 
             return data_pairs, values
 
 
+# General excel methods
+def _parse_ref(ref: str) -> tuple[int, int]:
+    """Converts an Excel-style cell reference (e.g. 'C12') into a tuple of (row, column) indexes.
+    Every reference of a sheet is unique, only the column letters repeat, and those are resolved from COL_INDEX.
+
+    Args:
+        ref (str): Cell reference string in Excel format (letters + digits), e.g. 'A1', 'BC23'.
+
+    Returns:
+        tuple[int, int]: The row number (int) and the column number (int), both starting from 1.
+    """
+
+    column, row = _CELL_RE.match(ref).groups()
+
+    return int(row), COL_INDEX[column]
+
+
+def _si_text(node: ET.Element) -> str:
+    """Returns the value of a shared string (<si>) node.
+    Rich text values are split into <r><t> runs, while the phonetic <rPh><t> runs are not part of the value.
+
+    Args:
+        node (ET.Element): The <si> node of the sharedStrings.xml.
+
+    Returns:
+        str: The value of the shared string.
+    """
+
+    text = node.findtext(NS_T)
+
+    if text is not None:
+        return text
+
+    return "".join(t.text or "" for t in node.iterfind(f"{NS_R}/{NS_T}"))
+
+
+def build_sheet_data(table: list[list], sst_index: dict[str, int], next_index: int) -> tuple[bytes, list[str]]:
+    """Generates the <row> nodes of the sheetData for the given table.
+    String values are referenced from the sharedStrings.xml, the ones not found there yet are registered in `sst_index`.
+
+    Args:
+        table (list[list]): 2D list to upload.
+        sst_index (dict[str, int]): Mapping of the shared strings to their index, updated in place.
+        next_index (int): Index of the next string appended to the sharedStrings.xml.
+
+    Returns:
+        tuple[bytes, list[str]]: The encoded rows, and the new strings to append to the sharedStrings.xml in order.
+    """
+
+    # Called once per cell, so the lookups are bound to locals outside the loop
+    parts = []
+    new_strings = []
+    append = parts.append
+    lookup = sst_index.get
+    col_names = COL_NAMES
+
+    for i, row in enumerate(table, 1):
+
+        row_id = str(i)
+
+        append(f'<row r="{row_id}" spans="1:{len(row)}" x14ac:dyDescent="0.25">')
+
+        for j, element in enumerate(row, 1):
+
+            # Handle string elements, they are stored in the sharedStrings.xml, the sheet file only contains the reference to this element
+            if isinstance(element, str):
+
+                index = lookup(element)
+
+                if index is None:
+
+                    # Instead of the value we insert the index to the sharedStrings.xml element
+                    index = sst_index[element] = next_index + len(new_strings)
+                    new_strings.append(element)
+
+                append(f'<c r="{col_names[j]}{row_id}" t="s"><v>{index}</v></c>')
+
+            else:
+                append(f'<c r="{col_names[j]}{row_id}"><v>{escape(str(element))}</v></c>')
+
+        append('</row>')
+
+    return ''.join(parts).encode('utf-8'), new_strings
+
+
 # General XML methods
 def process_xml(zip: ZipFile, filename: str, search_str: str, attrib_type: str="") -> list[str]:
     """Extracts and returns values from an XML file within a ZIP archive based on a given XPath and attribute type.
@@ -765,18 +1017,18 @@ def process_xml(zip: ZipFile, filename: str, search_str: str, attrib_type: str="
 
     stream = get_stream(zip, filename)
 
-    namespaces = gather_namespaces(BytesIO(stream.encode('utf-8')))
+    namespaces = gather_namespaces(stream)
 
     values = get_xml_value(stream, search_str, namespaces, attrib_type)
 
     return values
 
 
-def get_xml_value(stream: str, search_str: str, namespaces: dict, attrib_type: str="") -> None | list[ET.Element] | list[dict] | str:
-    """Parses XML from a string and retrieves elements or specific attribute values based on the search criteria.
+def get_xml_value(stream: bytes, search_str: str, namespaces: dict, attrib_type: str="") -> None | list[ET.Element] | list[dict] | str:
+    """Parses XML from bytes and retrieves elements or specific attribute values based on the search criteria.
 
     Args:
-        stream (str): XML content as a string.
+        stream (bytes): XML content in byte format.
         search_str (str): XPath expression to find elements.
         namespaces (dict): Namespace prefixes and URIs for XPath queries.
         attrib_type (str, optional): Determines the output format:
@@ -794,13 +1046,7 @@ def get_xml_value(stream: str, search_str: str, namespaces: dict, attrib_type: s
     """
 
 
-    output = None
-
-    tree = ET.ElementTree(ET.fromstring(stream))
-
-    root = tree.getroot()
-
-    output = root.findall(search_str, namespaces)
+    output = ET.fromstring(stream).findall(search_str, namespaces)
 
     if attrib_type == "text":
         output = [elem.text for elem in output]
@@ -817,11 +1063,11 @@ def get_xml_value(stream: str, search_str: str, namespaces: dict, attrib_type: s
     return output
 
 
-def gather_namespaces(file: BytesIO) -> dict[str, str]:
-    """Extracts XML namespaces from the given file-like object.
+def gather_namespaces(file: bytes) -> dict[str, str]:
+    """Extracts XML namespaces from the given XML content.
 
     Args:
-        file: (BytesIO): XML data in byte format.
+        file: (bytes): XML data in byte format.
 
     Returns:
         dict[str, str]: A dictionary mapping namespace prefixes to their URIs.
@@ -830,7 +1076,7 @@ def gather_namespaces(file: BytesIO) -> dict[str, str]:
 
     namespaces = {}
 
-    for event, elem in ET.iterparse(file, ("start", "start-ns")):
+    for event, elem in ET.iterparse(BytesIO(file), ("start", "start-ns")):
 
         if event == "start-ns":
 
@@ -846,20 +1092,79 @@ def gather_namespaces(file: BytesIO) -> dict[str, str]:
     return namespaces
 
 
-def get_stream(comp: ZipFile, filename: str) -> str:
-    """Reads and returns the content of a file inside a ZIP archive as a UTF-8 decoded string.
+def parse_with_namespaces(stream: bytes) -> tuple[ET.Element, dict[str, str]]:
+    """Parses XML content and extracts its namespaces in the same pass.
+
+    Args:
+        stream (bytes): XML data in byte format.
+
+    Returns:
+        tuple[ET.Element, dict[str, str]]: The root element of the parsed XML and a dictionary
+                                           mapping namespace prefixes to their URIs.
+                                           The default namespace is mapped to the key 'default'.
+    """
+
+    namespaces = {}
+
+    context = ET.iterparse(BytesIO(stream), ("start-ns",))
+
+    for _, (key, value) in context:
+
+        key = "default" if key == "" else key
+
+        # Keep the declarations of the outermost element, like gather_namespaces does
+        if key not in namespaces:
+
+            namespaces[key] = value
+
+            ET.register_namespace(key if key != "default" else '', value)
+
+    return context.root, namespaces
+
+
+def get_xml_declaration(stream: bytes) -> bytes:
+    """Returns the XML declaration of the content ie.: <?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+    ET.tostring does not keep it, so it has to be put back in front of the serialized content.
+
+    Args:
+        stream (bytes): XML data in byte format.
+
+    Returns:
+        bytes: The declaration, or empty bytes if the content does not start with one.
+    """
+
+    if not stream.startswith(b"<?xml"):
+        return b""
+
+    return stream[:stream.find(b"?>") + 2]
+
+
+def get_stream(comp: ZipFile, filename: str) -> bytes:
+    """Reads and returns the raw content of a file inside a ZIP archive.
 
     Args:
         comp (ZipFile): An open ZipFile object.
         filename (str): The path of the file inside the ZIP archive to read.
 
     Returns:
-        str: The decoded content of the specified file.
+        bytes: The undecoded content of the specified file.
     """
 
-    with comp.open(filename) as file:
+    return comp.read(filename)
+
+
+def _stream_xml(comp: ZipFile, filename: str) -> ZipExtFile:
+    """Opens a file inside a ZIP archive for streamed reading, so it can be parsed without loading it whole.
+
+    Args:
+        comp (ZipFile): An open ZipFile object.
+        filename (str): The path of the file inside the ZIP archive to read.
+
+    Returns:
+        ZipExtFile: File-like object decompressing the content on the fly.
+    """
 
-        return file.read().decode('utf-8')
+    return comp.open(filename, 'r')
     
 
 def remove_child_nodes(root: ET.Element, namespaces: dict[str, str], node_name: str) -> ET.Element: